@@ -852,6 +852,22 @@ class CursorResultMetaData(ResultMetaData):
             self._raise_for_ambiguous_column_name(rec)
         return index
 
+    def _getter_for_first_present(self, keys):
+        # membership checks against the keymap, rather than raising and
+        # catching KeyError for each key that's not present
+        keymap = self._keymap
+        for key in keys:
+            if isinstance(key, int):
+                key = self._keys[key]
+
+            rec = keymap.get(key)
+            if rec is not None:
+                index = rec[MD_INDEX]
+                if index is None:
+                    self._raise_for_ambiguous_column_name(rec)
+                return operator.itemgetter(index)
+        return None
+
     def _indexes_for_keys(self, keys):
         try:
             return [self._keymap[key][0] for key in keys]
@@ -176,6 +176,15 @@ class ResultMetaData:
         else:
             return None
 
+    def _getter_for_first_present(
+        self, keys: Sequence[Any]
+    ) -> Optional[Callable[[Row[Any]], Any]]:
+        for key in keys:
+            getter = self._getter(key, False)
+            if getter is not None:
+                return getter
+        return None
+
     def _row_as_tuple_getter(
         self, keys: Sequence[_KeyIndexType]
     ) -> _TupleGetterType:
@@ -1183,6 +1192,20 @@ class Result(_WithKeys, ResultInternal[Row[_TP]]):
             )
         return self._metadata._getter(key, raiseerr)
 
+    def _getter_for_first_present(
+        self, keys: Sequence[_KeyIndexType]
+    ) -> Optional[Callable[[Row[Any]], Any]]:
+        """return a callable that will retrieve the first of the given keys
+        that's present in a :class:`_engine.Row`, or None if none are
+        present.
+
+        """
+        if self._source_supports_scalars:
+            raise NotImplementedError(
+                "can't use this function in 'only scalars' mode"
+            )
+        return self._metadata._getter_for_first_present(keys)
+
     def _tuple_getter(self, keys: Sequence[_KeyIndexType]) -> _TupleGetterType:
         """return a callable that will retrieve the given keys from a
         :class:`_engine.Row`.
@@ -3245,4 +3245,13 @@ class QueryEvents(event.Events[Query[Any]]):
 
         wrap._bake_ok = bake_ok  # type: ignore [attr-defined]
 
+        if event_key.identifier == "before_compile":
+            event_key.dispatch_target._has_before_compile_events = True
+
         event_key.base_listen(**kw)
+
+    @classmethod
+    def _clear(cls) -> None:
+        super()._clear()
+        for query_cls in util.walk_subclasses(Query):
+            query_cls._has_before_compile_events = False
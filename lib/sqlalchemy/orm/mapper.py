@@ -3118,6 +3118,25 @@ class Mapper(
             and syn.name in pk_keys
         }
 
+    @HasMemoized.memoized_attribute
+    @util.preload_module("sqlalchemy.orm.strategies")
+    def _deferred_column_groups(self) -> Dict[str, List[str]]:
+        """return a dictionary of {group_name: [attribute keys]} for all
+        properties that are deferred as part of a named group
+
+        """
+        strategies = util.preloaded.orm_strategies
+
+        groups: Dict[str, List[str]] = {}
+        for prop in self.iterate_properties:
+            if (
+                isinstance(prop, StrategizedProperty)
+                and isinstance(prop.strategy, strategies.DeferredColumnLoader)
+                and prop.group
+            ):
+                groups.setdefault(prop.group, []).append(prop.key)
+        return groups
+
     @HasMemoized.memoized_attribute
     @util.preload_module("sqlalchemy.orm.descriptor_props")
     def synonyms(self) -> util.ReadOnlyProperties[SynonymProperty[Any]]:
@@ -112,6 +112,10 @@ class ColumnProperty(
 
     _links_to_entity = False
 
+    # consulted by the column loader strategies in place of a
+    # hasattr(prop, "composite_class") check
+    _is_composite = False
+
     columns: List[NamedColumn[Any]]
 
     _is_polymorphic_discriminator: bool
@@ -221,6 +221,9 @@ class Query(
 
     _statement: Optional[ExecutableReturnsRows] = None
 
+    # set by QueryEvents when a before_compile() listener is established
+    _has_before_compile_events = False
+
     session: Session
 
     dispatch: dispatcher[Query[_T]]
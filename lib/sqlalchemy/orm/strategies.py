@@ -13,7 +13,6 @@
 from __future__ import annotations
 
 import collections
-import itertools
 from typing import Any
 from typing import Dict
 from typing import Tuple
@@ -41,8 +40,6 @@ from .context import ORMCompileState
 from .context import ORMSelectCompileState
 from .context import QueryContext
 from .interfaces import LoaderStrategy
-from .interfaces import StrategizedProperty
-from .session import _state_session
 from .state import InstanceState
 from .strategy_options import Load
 from .util import _none_set
@@ -63,6 +60,23 @@ if TYPE_CHECKING:
     from ..sql.elements import ColumnElement
 
 
+# strategy keys for column loading that are looked up at load time
+_UNDEFERRED_COLUMN_KEY = (("deferred", False), ("instrument", True))
+_DEFERRED_COLUMN_KEY = (("deferred", True), ("instrument", True))
+_RAISELOAD_COLUMN_KEY = (
+    ("deferred", True),
+    ("instrument", True),
+    ("raiseload", True),
+)
+
+# execution options for lazy loads that must not autoflush
+_NO_AUTOFLUSH = util.immutabledict({"autoflush": False})
+
+# both are needed for a use_get lazy load to emit SQL after an identity map
+# miss
+_SQL_AND_RELATED_OBJECT_OK = PassiveFlag.SQL_OK | PassiveFlag.RELATED_OBJECT_OK
+
+
 def _register_attribute(
     prop,
     mapper,
@@ -75,34 +89,27 @@ def _register_attribute(
     impl_class=None,
     **kw,
 ):
+    # (hook, extra args) pairs, each invoked as hook(desc, prop, *args)
     listen_hooks = []
 
     uselist = useobject and prop.uselist
 
     if useobject and prop.single_parent:
-        listen_hooks.append(single_parent_validator)
+        listen_hooks.append((single_parent_validator, ()))
 
     if prop.key in prop.parent.validators:
         fn, opts = prop.parent.validators[prop.key]
-        listen_hooks.append(
-            lambda desc, prop: orm_util._validator_events(
-                desc, prop.key, fn, **opts
-            )
-        )
+        listen_hooks.append((_validator_hook, (fn, opts)))
 
     if useobject:
-        listen_hooks.append(unitofwork.track_cascade_events)
+        listen_hooks.append((unitofwork.track_cascade_events, ()))
 
     # need to assemble backref listeners
     # after the singleparentvalidator, mapper validator
     if useobject:
         backref = prop.back_populates
         if backref and prop._effective_sync_backref:
-            listen_hooks.append(
-                lambda desc, prop: attributes.backref_listeners(
-                    desc, backref, uselist
-                )
-            )
+            listen_hooks.append((_backref_hook, (backref, uselist)))
 
     # a single MapperProperty is shared down a class inheritance
     # hierarchy, so we set up attribute instrumentation and backref event
@@ -114,8 +121,15 @@ def _register_attribute(
     # mapper here might not be prop.parent; also, a subclass mapper may
     # be called here before a superclass mapper.  That is, can't depend
     # on mappers not already being set up so we have to check each one.
+    # a mapper with no inheriting mappers, the most common case, is
+    # checked directly without going through self_and_descendants.
 
-    for m in mapper.self_and_descendants:
+    if mapper._inheriting_mappers:
+        mappers = mapper.self_and_descendants
+    else:
+        mappers = (mapper,)
+
+    for m in mappers:
         if prop is m._props.get(
             prop.key
         ) and not m.class_manager._attr_has_impl(prop.key):
@@ -140,8 +154,39 @@ def _register_attribute(
                 **kw,
             )
 
-            for hook in listen_hooks:
-                hook(desc, prop)
+            for hook, args in listen_hooks:
+                hook(desc, prop, *args)
+
+
+def _validator_hook(desc, prop, fn, opts):
+    orm_util._validator_events(desc, prop.key, fn, **opts)
+
+
+def _backref_hook(desc, prop, backref, uselist):
+    attributes.backref_listeners(desc, backref, uselist)
+
+
+def _populate_from_first_present_column(
+    key, columns, result, adapter, populators
+):
+    """Set up a "quick" populator for the first of the given columns
+    present in the result, else an "expire" populator.
+
+    Shared by :class:`.ColumnLoader` and :class:`.ExpressionColumnLoader`;
+    this runs once per result, the per-row work being only the getter
+    itself.
+
+    """
+    # look through list of columns represented here
+    # to see which, if any, is present in the row.
+    if adapter:
+        columns = [adapter.columns[col] for col in columns]
+
+    getter = result._getter_for_first_present(columns)
+    if getter:
+        populators["quick"].append((key, getter))
+    else:
+        populators["expire"].append((key, True))
 
 
 @properties.ColumnProperty.strategy_for(instrument=False, deferred=False)
@@ -157,7 +202,7 @@ class UninstrumentedColumnLoader(LoaderStrategy):
 
     def __init__(self, parent, strategy_key):
         super().__init__(parent, strategy_key)
-        self.columns = self.parent_property.columns
+        self.columns = tuple(self.parent_property.columns)
 
     def setup_query(
         self,
@@ -169,9 +214,11 @@ class UninstrumentedColumnLoader(LoaderStrategy):
         column_collection=None,
         **kwargs,
     ):
-        for c in self.columns:
-            if adapter:
-                c = adapter.columns[c]
+        columns = self.columns
+        if adapter:
+            columns = [adapter.columns[c] for c in columns]
+
+        for c in columns:
             compile_state._append_dedupe_col_collection(c, column_collection)
 
     def create_row_processor(
@@ -193,12 +240,15 @@ class UninstrumentedColumnLoader(LoaderStrategy):
 class ColumnLoader(LoaderStrategy):
     """Provide loading behavior for a :class:`.ColumnProperty`."""
 
-    __slots__ = "columns", "is_composite"
+    __slots__ = "columns", "is_composite", "_single_column"
 
     def __init__(self, parent, strategy_key):
         super().__init__(parent, strategy_key)
-        self.columns = self.parent_property.columns
-        self.is_composite = hasattr(self.parent_property, "composite_class")
+        self.columns = columns = tuple(self.parent_property.columns)
+        self.is_composite = self.parent_property._is_composite
+
+        # a plain mapped column is by far the most common case
+        self._single_column = columns[0] if len(columns) == 1 else None
 
     def setup_query(
         self,
@@ -212,24 +262,39 @@ class ColumnLoader(LoaderStrategy):
         check_for_adapt=False,
         **kwargs,
     ):
-        for c in self.columns:
-            if adapter:
+        append_col = compile_state._append_dedupe_col_collection
+
+        if adapter:
+            # adapt each column once; the adapted form of the first
+            # column is also the one the attribute is populated from
+            if check_for_adapt:
+                adapt_col = adapter.adapt_check_present
+            else:
+                adapted_cols = adapter.columns
+
+            columns = []
+            for c in self.columns:
                 if check_for_adapt:
-                    c = adapter.adapt_check_present(c)
+                    c = adapt_col(c)
                     if c is None:
                         return
                 else:
-                    c = adapter.columns[c]
-
-            compile_state._append_dedupe_col_collection(c, column_collection)
+                    c = adapted_cols[c]
+                columns.append(c)
+                append_col(c, column_collection)
 
-        fetch = self.columns[0]
-        if adapter:
-            fetch = adapter.columns[fetch]
+            fetch = columns[0]
             if fetch is None:
                 # None happens here only for dml bulk_persistence cases
                 # when context.DMLReturningColFilter is used
                 return
+        elif self._single_column is not None:
+            fetch = self._single_column
+            append_col(fetch, column_collection)
+        else:
+            for c in self.columns:
+                append_col(c, column_collection)
+            fetch = self.columns[0]
 
         memoized_populators[self.parent_property] = fetch
 
@@ -266,18 +331,9 @@ class ColumnLoader(LoaderStrategy):
         adapter,
         populators,
     ):
-        # look through list of columns represented here
-        # to see which, if any, is present in the row.
-
-        for col in self.columns:
-            if adapter:
-                col = adapter.columns[col]
-            getter = result._getter(col, False)
-            if getter:
-                populators["quick"].append((self.key, getter))
-                break
-        else:
-            populators["expire"].append((self.key, True))
+        _populate_from_first_present_column(
+            self.key, self.columns, result, adapter, populators
+        )
 
 
 @log.class_logger
@@ -307,26 +363,25 @@ class ExpressionColumnLoader(ColumnLoader):
     ):
         columns = None
         if loadopt and "expression" in loadopt.local_opts:
-            columns = [loadopt.local_opts["expression"]]
+            columns = (loadopt.local_opts["expression"],)
         elif self._have_default_expression:
-            columns = self.parent_property.columns
+            columns = self.columns
 
         if columns is None:
             return
 
+        if adapter:
+            columns = [adapter.columns[c] for c in columns]
+
         for c in columns:
-            if adapter:
-                c = adapter.columns[c]
             compile_state._append_dedupe_col_collection(c, column_collection)
 
         fetch = columns[0]
-        if adapter:
-            fetch = adapter.columns[fetch]
-            if fetch is None:
-                # None is not expected to be the result of any
-                # adapter implementation here, however there may be theoretical
-                # usages of returning() with context.DMLReturningColFilter
-                return
+        if fetch is None:
+            # None is not expected to be the result of any
+            # adapter implementation here, however there may be theoretical
+            # usages of returning() with context.DMLReturningColFilter
+            return
 
         memoized_populators[self.parent_property] = fetch
 
@@ -341,20 +396,14 @@ class ExpressionColumnLoader(ColumnLoader):
         adapter,
         populators,
     ):
-        # look through list of columns represented here
-        # to see which, if any, is present in the row.
         if loadopt and "expression" in loadopt.local_opts:
-            columns = [loadopt.local_opts["expression"]]
-
-            for col in columns:
-                if adapter:
-                    col = adapter.columns[col]
-                getter = result._getter(col, False)
-                if getter:
-                    populators["quick"].append((self.key, getter))
-                    break
-            else:
-                populators["expire"].append((self.key, True))
+            _populate_from_first_present_column(
+                self.key,
+                (loadopt.local_opts["expression"],),
+                result,
+                adapter,
+                populators,
+            )
 
     def init_class_attribute(self, mapper):
         self.is_class_level = True
@@ -377,17 +426,39 @@ class ExpressionColumnLoader(ColumnLoader):
 class DeferredColumnLoader(LoaderStrategy):
     """Provide loading behavior for a deferred :class:`.ColumnProperty`."""
 
-    __slots__ = "columns", "group", "raiseload"
+    __slots__ = (
+        "columns",
+        "group",
+        "raiseload",
+        "_key_set",
+        "_undeferred_loader",
+        "_undefer_in_wildcard",
+    )
 
     def __init__(self, parent, strategy_key):
         super().__init__(parent, strategy_key)
-        if hasattr(self.parent_property, "composite_class"):
+        if self.parent_property._is_composite:
             raise NotImplementedError(
                 "Deferred loading for composite " "types not implemented yet"
             )
         self.raiseload = self.strategy_opts.get("raiseload", False)
-        self.columns = self.parent_property.columns
+        self.columns = tuple(self.parent_property.columns)
         self.group = self.parent_property.group
+        self._key_set = frozenset((self.key,))
+
+        # primary key and polymorphic_on columns are loaded whenever the
+        # query has loader options, even if mapped as deferred
+        self._undefer_in_wildcard = (
+            not self.parent._should_undefer_in_wildcard.isdisjoint(
+                self.columns
+            )
+        )
+
+        # the loader used when this column is undeferred for a
+        # particular query
+        self._undeferred_loader = self.parent_property._get_strategy(
+            _UNDEFERRED_COLUMN_KEY
+        )
 
     def create_row_processor(
         self,
@@ -414,9 +485,7 @@ class DeferredColumnLoader(LoaderStrategy):
             and context.query._compile_options._only_load_props
             and self.key in context.query._compile_options._only_load_props
         ):
-            self.parent_property._get_strategy(
-                (("deferred", False), ("instrument", True))
-            ).create_row_processor(
+            self._undeferred_loader.create_row_processor(
                 context,
                 query_entity,
                 path,
@@ -469,12 +538,7 @@ class DeferredColumnLoader(LoaderStrategy):
                 compile_state.compile_options._render_for_subquery
                 and self.parent_property._renders_in_subqueries
             )
-            or (
-                loadopt
-                and set(self.columns).intersection(
-                    self.parent._should_undefer_in_wildcard
-                )
-            )
+            or (loadopt and self._undefer_in_wildcard)
             or (
                 loadopt
                 and self.group
@@ -484,9 +548,7 @@ class DeferredColumnLoader(LoaderStrategy):
             )
             or (only_load_props and self.key in only_load_props)
         ):
-            self.parent_property._get_strategy(
-                (("deferred", False), ("instrument", True))
-            ).setup_query(
+            self._undeferred_loader.setup_query(
                 compile_state,
                 query_entity,
                 path,
@@ -512,21 +574,19 @@ class DeferredColumnLoader(LoaderStrategy):
 
         localparent = state.manager.mapper
 
+        # narrow the keys down to just those which have no history
         if self.group:
-            toload = [
-                p.key
-                for p in localparent.iterate_properties
-                if isinstance(p, StrategizedProperty)
-                and isinstance(p.strategy, DeferredColumnLoader)
-                and p.group == self.group
-            ]
+            group = state.unmodified_intersection(
+                localparent._deferred_column_groups.get(self.group, ())
+            )
+        elif (
+            self.key in state.manager and self.key not in state.committed_state
+        ):
+            group = self._key_set
         else:
-            toload = [self.key]
+            group = set()
 
-        # narrow the keys down to just those which have no history
-        group = [k for k in toload if k in state.unmodified]
-
-        session = _state_session(state)
+        session = state.session
         if session is None:
             raise orm_exc.DetachedInstanceError(
                 "Parent instance %s is not bound to a Session; "
@@ -537,9 +597,7 @@ class DeferredColumnLoader(LoaderStrategy):
         if self.raiseload:
             self._invoke_raise_load(state, passive, "raise")
 
-        loading.load_scalar_attributes(
-            state.mapper, state, set(group), PASSIVE_OFF
-        )
+        loading.load_scalar_attributes(state.mapper, state, group, PASSIVE_OFF)
 
         return LoaderCallableStatus.ATTR_WAS_SET
 
@@ -562,13 +620,9 @@ class LoadDeferredColumns:
         localparent = state.manager.mapper
         prop = localparent._props[key]
         if self.raiseload:
-            strategy_key = (
-                ("deferred", True),
-                ("instrument", True),
-                ("raiseload", True),
-            )
+            strategy_key = _RAISELOAD_COLUMN_KEY
         else:
-            strategy_key = (("deferred", True), ("instrument", True))
+            strategy_key = _DEFERRED_COLUMN_KEY
         strategy = prop._get_strategy(strategy_key)
         return strategy._load_for_state(state, passive)
 
@@ -681,6 +735,7 @@ class LazyLoader(
         "_lazywhere",
         "_rev_lazywhere",
         "_lazyload_reverse_option",
+        "_lazyload_reverse_targets",
         "_order_by",
         "use_get",
         "is_aliased_class",
@@ -689,8 +744,12 @@ class LazyLoader(
         "_rev_bind_to_col",
         "_rev_equated_columns",
         "_simple_lazy_clause",
+        "_lazy_stmt_template",
+        "_lazy_load_options",
+        "_use_get_cols",
         "_raise_always",
         "_raise_on_sql",
+        "_single_pk",
     )
 
     _lazywhere: ColumnElement[bool]
@@ -730,6 +789,11 @@ class LazyLoader(
         else:
             self._order_by = None
 
+        self._lazyload_reverse_option = (
+            (self._lazyload_reverse, self.parent_property),
+        )
+        self._lazyload_reverse_targets = None
+
         self.logger.info("%s lazy loading clause %s", self, self._lazywhere)
 
         # determine if our "lazywhere" clause is the same as the mapper's
@@ -739,9 +803,17 @@ class LazyLoader(
         # load that populates for a list (very unusual, but is possible with
         # the API) can still set for "None" and the attribute system will
         # populate as an empty list.
+        #
+        # the get() clause compares each primary key column to a bound
+        # parameter, so a lazy clause that joins through a secondary table,
+        # or has more distinct bound parameters than there are primary key
+        # columns, can't match; check for those cheaply before comparing
+        # the two clauses structurally.
         self.use_get = (
             not self.is_aliased_class
             and not self.uselist
+            and self.parent_property.secondary is None
+            and len(self._bind_to_col) <= len(self.entity._get_clause[1])
             and self.entity._get_clause[0].compare(
                 self._lazywhere,
                 use_proxies=True,
@@ -750,6 +822,8 @@ class LazyLoader(
             )
         )
 
+        self._single_pk = len(self.mapper.primary_key) == 1
+
         if self.use_get:
             for col in list(self._equated_columns):
                 if col in self.mapper._equivalent_columns:
@@ -794,6 +868,34 @@ class LazyLoader(
             _deferred_history=_deferred_history,
         )
 
+    def _memoized_attr__lazy_stmt_template(self):
+        # base SELECT for lazy loads; _emit_lazyload() works on a
+        # _generate() copy of it
+        clauseelement = self.entity.__clause_element__()
+        stmt = Select._create_raw_select(
+            _raw_columns=[clauseelement],
+            _propagate_attrs=clauseelement._propagate_attrs,
+            _label_style=LABEL_STYLE_TABLENAME_PLUS_COL,
+            _compile_options=ORMCompileState.default_compile_options,
+        )
+        if self.parent_property.secondary is not None:
+            stmt = stmt.select_from(
+                self.mapper, self.parent_property.secondary
+            )
+        return stmt
+
+    def _memoized_attr__lazy_load_options(self):
+        return QueryContext.default_load_options + {
+            "_invoke_all_eagers": False
+        }
+
+    def _memoized_attr__use_get_cols(self):
+        # local columns equated to each primary key column of the target,
+        # in primary key order, for a use_get load
+        return tuple(
+            self._equated_columns[pk] for pk in self.mapper.primary_key
+        )
+
     def _memoized_attr__simple_lazy_clause(self):
         lazywhere = sql_util._deep_annotate(
             self._lazywhere, {"_orm_adapt": True}
@@ -803,12 +905,12 @@ class LazyLoader(
 
         params = []
 
+        # _deep_annotate() has already produced a copy of the lazy clause
+        # local to this method, so its bound parameters can be made
+        # non-unique in place, and the parameters collected in the same
+        # walk, without a further cloned traversal
         def visit_bindparam(bindparam):
             bindparam.unique = False
-
-        visitors.traverse(criterion, {}, {"bindparam": visit_bindparam})
-
-        def visit_bindparam(bindparam):
             if bindparam._identifying_key in bind_to_col:
                 params.append(
                     (
@@ -820,14 +922,27 @@ class LazyLoader(
             elif bindparam.callable is None:
                 params.append((bindparam.key, None, bindparam.value))
 
-        criterion = visitors.cloned_traverse(
-            criterion, {}, {"bindparam": visit_bindparam}
+        visitors.traverse(criterion, {}, {"bindparam": visit_bindparam})
+
+        # split out the parameters that are fixed values from those that
+        # are pulled from the parent state, so that the per-load work
+        # only includes the latter
+        literal_params = {
+            key: value for key, ident, value in params if ident is None
+        }
+        state_params = tuple(
+            (key, ident) for key, ident, value in params if ident is not None
         )
 
-        return criterion, params
+        return criterion, params, literal_params, state_params
 
     def _generate_lazy_clause(self, state, passive):
-        criterion, param_keys = self._simple_lazy_clause
+        (
+            criterion,
+            param_keys,
+            literal_params,
+            state_params,
+        ) = self._simple_lazy_clause
 
         if state is None:
             return sql_util.adapt_criterion_to_null(
@@ -839,22 +954,16 @@ class LazyLoader(
         o = state.obj()  # strong ref
         dict_ = attributes.instance_dict(o)
 
-        if passive & PassiveFlag.INIT_OK:
-            passive ^= PassiveFlag.INIT_OK
+        passive &= ~PassiveFlag.INIT_OK
 
-        params = {}
-        for key, ident, value in param_keys:
-            if ident is not None:
-                if passive and passive & PassiveFlag.LOAD_AGAINST_COMMITTED:
-                    value = mapper._get_committed_state_attr_by_column(
-                        state, dict_, ident, passive
-                    )
-                else:
-                    value = mapper._get_state_attr_by_column(
-                        state, dict_, ident, passive
-                    )
+        if passive & PassiveFlag.LOAD_AGAINST_COMMITTED:
+            get_attr = mapper._get_committed_state_attr_by_column
+        else:
+            get_attr = mapper._get_state_attr_by_column
 
-            params[key] = value
+        params = dict(literal_params)
+        for key, ident in state_params:
+            params[key] = get_attr(state, dict_, ident, passive)
 
         return criterion, params
 
@@ -885,9 +994,14 @@ class LazyLoader(
         pending = not state.key
         primary_key_identity = None
 
+        # flags consulted more than once below
+        sql_ok = passive & PassiveFlag.SQL_OK
+        no_raise = passive & PassiveFlag.NO_RAISE
+        related_object_ok = passive & PassiveFlag.RELATED_OBJECT_OK
+
         use_get = self.use_get and (not loadopt or not loadopt._extra_criteria)
 
-        if (not passive & PassiveFlag.SQL_OK and not use_get) or (
+        if (not sql_ok and not use_get) or (
             not passive & attributes.NON_PERSISTENT_OK and pending
         ):
             return LoaderCallableStatus.PASSIVE_NO_RESULT
@@ -896,7 +1010,7 @@ class LazyLoader(
             # we were given lazy="raise"
             self._raise_always
             # the no_raise history-related flag was not passed
-            and not passive & PassiveFlag.NO_RAISE
+            and not no_raise
             and (
                 # if we are use_get and related_object_ok is disabled,
                 # which means we are at most looking in the identity map
@@ -904,14 +1018,14 @@ class LazyLoader(
                 # PASSIVE_NO_RESULT, don't raise.  This is also a
                 # history-related flag
                 not use_get
-                or passive & PassiveFlag.RELATED_OBJECT_OK
+                or related_object_ok
             )
         ):
             self._invoke_raise_load(state, passive, "raise")
 
-        session = _state_session(state)
+        session = state.session
         if not session:
-            if passive & PassiveFlag.NO_RAISE:
+            if no_raise:
                 return LoaderCallableStatus.PASSIVE_NO_RESULT
 
             raise orm_exc.DetachedInstanceError(
@@ -931,7 +1045,13 @@ class LazyLoader(
             elif LoaderCallableStatus.NEVER_SET in primary_key_identity:
                 return LoaderCallableStatus.NEVER_SET
 
-            if _none_set.issuperset(primary_key_identity):
+            # PASSIVE_NO_RESULT and NEVER_SET are ruled out above, so for a
+            # single column primary key only None remains to be checked
+            if (
+                primary_key_identity[0] is None
+                if self._single_pk
+                else _none_set.issuperset(primary_key_identity)
+            ):
                 return None
 
             if (
@@ -958,9 +1078,8 @@ class LazyLoader(
                 else:
                     return instance
             elif (
-                not passive & PassiveFlag.SQL_OK
-                or not passive & PassiveFlag.RELATED_OBJECT_OK
-            ):
+                passive & _SQL_AND_RELATED_OBJECT_OK
+            ) != _SQL_AND_RELATED_OBJECT_OK:
                 return LoaderCallableStatus.PASSIVE_NO_RESULT
 
         return self._emit_lazyload(
@@ -986,11 +1105,38 @@ class LazyLoader(
         dict_ = state.dict
 
         return [
-            get_attr(state, dict_, self._equated_columns[pk], passive=passive)
-            for pk in self.mapper.primary_key
+            get_attr(state, dict_, col, passive=passive)
+            for col in self._use_get_cols
         ]
 
     @util.preload_module("sqlalchemy.orm.strategy_options")
+    def _lazyload_reverse(self, compile_context):
+        strategy_options = util.preloaded.orm_strategy_options
+
+        # _reverse_property only grows, as relationships that refer back
+        # to this one are configured, so its size tells if the filtered
+        # targets are current
+        reverse_property = self.parent_property._reverse_property
+        targets = self._lazyload_reverse_targets
+        if targets is None or targets[0] != len(reverse_property):
+            targets = self._lazyload_reverse_targets = (
+                len(reverse_property),
+                tuple(
+                    rev
+                    for rev in reverse_property
+                    # reverse props that are MANYTOONE are loading *this*
+                    # object from get(), so don't need to eager out to those.
+                    if rev.direction is interfaces.MANYTOONE
+                    and rev._use_get
+                    and not isinstance(rev.strategy, LazyLoader)
+                ),
+            )
+
+        for rev in targets[1]:
+            strategy_options.Load._construct_for_existing_path(
+                compile_context.compile_options._current_path[rev.parent]
+            ).lazyload(rev).process_compile_state(compile_context)
+
     def _emit_lazyload(
         self,
         session,
@@ -1003,32 +1149,14 @@ class LazyLoader(
         alternate_effective_path,
         execution_options,
     ):
-        strategy_options = util.preloaded.orm_strategy_options
-
-        clauseelement = self.entity.__clause_element__()
-        stmt = Select._create_raw_select(
-            _raw_columns=[clauseelement],
-            _propagate_attrs=clauseelement._propagate_attrs,
-            _label_style=LABEL_STYLE_TABLENAME_PLUS_COL,
-            _compile_options=ORMCompileState.default_compile_options,
-        )
-        load_options = QueryContext.default_load_options
-
-        load_options += {
-            "_invoke_all_eagers": False,
-            "_lazy_loaded_from": state,
-        }
-
-        if self.parent_property.secondary is not None:
-            stmt = stmt.select_from(
-                self.mapper, self.parent_property.secondary
-            )
+        stmt = self._lazy_stmt_template._generate()
+        load_options = self._lazy_load_options + {"_lazy_loaded_from": state}
 
         pending = not state.key
 
         # don't autoflush on pending
         if pending or passive & attributes.NO_AUTOFLUSH:
-            stmt._execution_options = util.immutabledict({"autoflush": False})
+            stmt._execution_options = _NO_AUTOFLUSH
 
         use_get = self.use_get
 
@@ -1075,24 +1203,7 @@ class LazyLoader(
         if self._order_by:
             stmt._order_by_clauses = self._order_by
 
-        def _lazyload_reverse(compile_context):
-            for rev in self.parent_property._reverse_property:
-                # reverse props that are MANYTOONE are loading *this*
-                # object from get(), so don't need to eager out to those.
-                if (
-                    rev.direction is interfaces.MANYTOONE
-                    and rev._use_get
-                    and not isinstance(rev.strategy, LazyLoader)
-                ):
-                    strategy_options.Load._construct_for_existing_path(
-                        compile_context.compile_options._current_path[
-                            rev.parent
-                        ]
-                    ).lazyload(rev).process_compile_state(compile_context)
-
-        stmt._with_context_options += (
-            (_lazyload_reverse, self.parent_property),
-        )
+        stmt._with_context_options += self._lazyload_reverse_option
 
         lazy_clause, params = self._generate_lazy_clause(state, passive)
 
@@ -1114,11 +1225,11 @@ class LazyLoader(
         ):
             return LoaderCallableStatus.ATTR_WAS_SET
 
-        if pending:
-            if util.has_intersection(orm_util._none_set, params.values()):
-                return None
-
-        elif util.has_intersection(orm_util._never_set, params.values()):
+        # a pending object can't lazy load if any of its bound values are
+        # None or unset; a persistent one only if any are unset.  as with
+        # util.has_intersection(), unhashable values are skipped
+        no_load_values = orm_util._none_set if pending else orm_util._never_set
+        if any(v.__hash__ and v in no_load_values for v in params.values()):
             return None
 
         if self._raise_on_sql and not passive & PassiveFlag.NO_RAISE:
@@ -1273,7 +1384,14 @@ class LoadLazyAttribute:
 class PostLoader(AbstractRelationshipLoader):
     """A relationship loader that emits a second SELECT statement."""
 
-    __slots__ = ()
+    __slots__ = ("_recursion_depth_key",)
+
+    def __init__(self, parent, strategy_key):
+        super().__init__(parent, strategy_key)
+
+        # execution option tracking the remaining recursion_depth for
+        # this loader
+        self._recursion_depth_key = f"_recursion_depth_{id(self)}"
 
     def _setup_for_recursion(self, context, path, loadopt, join_depth=None):
         effective_path = (
@@ -1300,7 +1418,7 @@ class PostLoader(AbstractRelationshipLoader):
                     "non-self-referential relationship"
                 )
             recursion_depth = context.execution_options.get(
-                f"_recursion_depth_{id(self)}", recursion_depth
+                self._recursion_depth_key, recursion_depth
             )
 
             if not unlimited_recursion and recursion_depth < 0:
@@ -1313,9 +1431,7 @@ class PostLoader(AbstractRelationshipLoader):
 
             if not unlimited_recursion:
                 execution_options = execution_options.union(
-                    {
-                        f"_recursion_depth_{id(self)}": recursion_depth - 1,
-                    }
+                    {self._recursion_depth_key: recursion_depth - 1}
                 )
 
         if loading.PostLoad.path_exists(
@@ -1521,25 +1637,39 @@ class SubqueryLoader(PostLoader):
         #    has to do the full compile context for multiply-nested
         #    from_self() (Neutron) - see test_subqload_from_self
         #    for demo.
-        q2 = query.Query.__new__(query.Query)
-        q2.__dict__.update(q.__dict__)
-        q = q2
+        # When neither applies, the Select is used directly, skipping the
+        # copies made by Query.subquery().  A select() that was never a
+        # Query may still have Core level compile options here.
+        compile_options = ORMCompileState.default_compile_options.safe_merge(
+            q._compile_options
+        )
+        as_query = (
+            query.Query._has_before_compile_events
+            or compile_options._set_base_alias
+        )
+        if as_query:
+            q2 = query.Query.__new__(query.Query)
+            q2.__dict__.update(q.__dict__)
+            q = q2
 
         # set the query's "FROM" list explicitly to what the
         # FROM list would be in any case, as we will be limiting
         # the columns in the SELECT list which may no longer include
         # all entities mentioned in things like WHERE, JOIN, etc.
         if not q._from_obj:
-            q._enable_assertions = False
+            if as_query:
+                q._enable_assertions = False
+            # dict.fromkeys() removes duplicates while keeping the
+            # entities in the order of the original query's columns
             q.select_from.non_generative(
                 q,
-                *{
+                *dict.fromkeys(
                     ent["entity"]
                     for ent in _column_descriptions(
                         orig_query, compile_state=orig_compile_state
                     )
                     if ent["entity"] is not None
-                },
+                ),
             )
 
         # select from the identity columns of the outer (specifically, these
@@ -1571,16 +1701,16 @@ class SubqueryLoader(PostLoader):
         elif distinct_target_key is None:
             # if target_cols refer to a non-primary key or only
             # part of a composite primary key, set the q as distinct
+            target_col_set = set(target_cols)
             for t in {c.table for c in target_cols}:
-                if not set(target_cols).issuperset(t.primary_key):
+                if not target_col_set.issuperset(t.primary_key):
                     q._distinct = True
                     break
 
         # don't need ORDER BY if no limit/offset
-        if not q._has_row_limiting_clause:
+        if q._limit_clause is None and q._offset_clause is None:
             q._order_by_clauses = ()
-
-        if q._distinct is True and q._order_by_clauses:
+        elif q._distinct is True and q._order_by_clauses:
             # the logic to automatically add the order by columns to the query
             # when distinct is True is deprecated in the query
             to_add = sql_util.expand_column_list_from_order_by(
@@ -1591,9 +1721,21 @@ class SubqueryLoader(PostLoader):
 
         # the original query now becomes a subquery
         # which we'll join onto.
-        # LEGACY: as "q" is a Query, the before_compile() event is invoked
-        # here.
-        embed_q = q.set_label_style(LABEL_STYLE_TABLENAME_PLUS_COL).subquery()
+        if as_query:
+            # LEGACY: as "q" is a Query, the before_compile() event is
+            # invoked here.
+            embed_q = q.set_label_style(
+                LABEL_STYLE_TABLENAME_PLUS_COL
+            ).subquery()
+        else:
+            # the same options Query.subquery() would have applied
+            q._label_style = LABEL_STYLE_TABLENAME_PLUS_COL
+            q._compile_options = compile_options + {
+                "_enable_eagerloads": False,
+                "_for_statement": True,
+                "_use_legacy_query_style": True,
+            }
+            embed_q = q.subquery()
         left_alias = orm_util.AliasedClass(
             leftmost_mapper, embed_q, use_mapper_path=True
         )
@@ -1602,23 +1744,21 @@ class SubqueryLoader(PostLoader):
     def _prep_for_joins(self, left_alias, subq_path):
         # figure out what's being joined.  a.k.a. the fun part
         to_join = []
-        pairs = list(subq_path.pairs())
-
-        for i, (mapper, prop) in enumerate(pairs):
-            if i > 0:
-                # look at the previous mapper in the chain -
-                # if it is as or more specific than this prop's
-                # mapper, use that instead.
-                # note we have an assumption here that
-                # the non-first element is always going to be a mapper,
-                # not an AliasedClass
-
-                prev_mapper = pairs[i - 1][1].mapper
-                to_append = prev_mapper if prev_mapper.isa(mapper) else mapper
+        prev_mapper = None
+
+        for mapper, prop in subq_path.pairs():
+            # look at the previous mapper in the chain -
+            # if it is as or more specific than this prop's
+            # mapper, use that instead.
+            # note we have an assumption here that
+            # the non-first element is always going to be a mapper,
+            # not an AliasedClass
+            if prev_mapper is not None and prev_mapper.isa(mapper):
+                to_join.append((prev_mapper, prop.key))
             else:
-                to_append = mapper
+                to_join.append((mapper, prop.key))
 
-            to_join.append((to_append, prop.key))
+            prev_mapper = prop.mapper
 
         # determine the immediate parent class we are joining from,
         # which needs to be aliased.
@@ -1671,17 +1811,14 @@ class SubqueryLoader(PostLoader):
                 )
                 for item in to_join[1:-1]
             ]
-            inner = []
-
-            while middle:
-                item = middle.pop(0)
-                attr = getattr(item[0], item[1])
-                if middle:
-                    attr = attr.of_type(middle[0][0])
-                else:
-                    attr = attr.of_type(parent_alias)
-
-                inner.append(attr)
+            # each middle alias joins to the next one, the last to
+            # parent_alias
+            targets = [alias for alias, key in middle[1:]]
+            targets.append(parent_alias)
+            inner = [
+                getattr(alias, key).of_type(target)
+                for (alias, key), target in zip(middle, targets)
+            ]
 
             to_join = (
                 [getattr(left_alias, to_join[0][1]).of_type(inner[0].parent)]
@@ -1778,7 +1915,7 @@ class SubqueryLoader(PostLoader):
             return self._data.get(key, default)
 
         def _load(self):
-            self._data = collections.defaultdict(list)
+            self._data = data = collections.defaultdict(list)
 
             q = self.subq
             assert q.session is None
@@ -1790,9 +1927,8 @@ class SubqueryLoader(PostLoader):
             # to work with baked query, the parameters may have been
             # updated since this query was created, so take these into account
 
-            rows = list(q.params(self.params))
-            for k, v in itertools.groupby(rows, lambda x: x[1:]):
-                self._data[k].extend(vv[0] for vv in v)
+            for row in q.params(self.params):
+                data[row[1:]].append(row[0])
 
         def loader(self, state, dict_, row):
             if self._data is None:
@@ -1903,7 +2039,9 @@ class SubqueryLoader(PostLoader):
 
         q = query.Query(effective_entity)
 
-        q._execution_options = q._execution_options.union(
+        # the new Query has no execution options of its own yet, so
+        # construct them directly rather than unioning into an empty dict
+        q._execution_options = util.immutabledict(
             {
                 ("orig_query", SubqueryLoader): orig_query,
                 ("subquery_paths", None): (subq_path, rewritten_path),
@@ -1984,32 +2122,34 @@ class SubqueryLoader(PostLoader):
         elif not orm_util._entity_isa(path[-1], self.parent):
             return
 
-        subq = self._setup_query_from_rowproc(
-            context,
-            query_entity,
-            path,
-            path[-1],
-            loadopt,
-            adapter,
-        )
+        # cache the loaded collections in the context
+        # so that inheriting mappers don't re-load when they
+        # call upon create_row_processor again; the subquery is only
+        # generated the first time
+        collections_path = path[self.parent_property]
+        collections = collections_path.get(context.attributes, "collections")
+        if collections is None:
+            subq = self._setup_query_from_rowproc(
+                context,
+                query_entity,
+                path,
+                path[-1],
+                loadopt,
+                adapter,
+            )
 
-        if subq is None:
-            return
+            if subq is None:
+                return
 
-        assert subq.session is None
+            assert subq.session is None
 
-        path = path[self.parent_property]
+            collections = self._SubqCollections(context, subq)
+            collections_path.set(
+                context.attributes, "collections", collections
+            )
 
         local_cols = self.parent_property.local_columns
 
-        # cache the loaded collections in the context
-        # so that inheriting mappers don't re-load when they
-        # call upon create_row_processor again
-        collections = path.get(context.attributes, "collections")
-        if collections is None:
-            collections = self._SubqCollections(context, subq)
-            path.set(context.attributes, "collections", collections)
-
         if adapter:
             local_cols = [adapter.columns[c] for c in local_cols]
 
@@ -2026,20 +2166,20 @@ class SubqueryLoader(PostLoader):
         self, context, result, collections, local_cols, populators
     ):
         tuple_getter = result._tuple_getter(local_cols)
+        key = self.key
+        get_collection = collections.get
 
         def load_collection_from_subq(state, dict_, row):
-            collection = collections.get(tuple_getter(row), ())
-            state.get_impl(self.key).set_committed_value(
-                state, dict_, collection
-            )
+            collection = get_collection(tuple_getter(row), ())
+            state.get_impl(key).set_committed_value(state, dict_, collection)
 
         def load_collection_from_subq_existing_row(state, dict_, row):
-            if self.key not in dict_:
+            if key not in dict_:
                 load_collection_from_subq(state, dict_, row)
 
-        populators["new"].append((self.key, load_collection_from_subq))
+        populators["new"].append((key, load_collection_from_subq))
         populators["existing"].append(
-            (self.key, load_collection_from_subq_existing_row)
+            (key, load_collection_from_subq_existing_row)
         )
 
         if context.invoke_all_eagers:
@@ -2049,9 +2189,11 @@ class SubqueryLoader(PostLoader):
         self, context, result, collections, local_cols, populators
     ):
         tuple_getter = result._tuple_getter(local_cols)
+        key = self.key
+        get_collection = collections.get
 
         def load_scalar_from_subq(state, dict_, row):
-            collection = collections.get(tuple_getter(row), (None,))
+            collection = get_collection(tuple_getter(row), (None,))
             if len(collection) > 1:
                 util.warn(
                     "Multiple rows returned with "
@@ -2059,15 +2201,15 @@ class SubqueryLoader(PostLoader):
                 )
 
             scalar = collection[0]
-            state.get_impl(self.key).set_committed_value(state, dict_, scalar)
+            state.get_impl(key).set_committed_value(state, dict_, scalar)
 
         def load_scalar_from_subq_existing_row(state, dict_, row):
-            if self.key not in dict_:
+            if key not in dict_:
                 load_scalar_from_subq(state, dict_, row)
 
-        populators["new"].append((self.key, load_scalar_from_subq))
+        populators["new"].append((key, load_scalar_from_subq))
         populators["existing"].append(
-            (self.key, load_scalar_from_subq_existing_row)
+            (key, load_scalar_from_subq_existing_row)
         )
         if context.invoke_all_eagers:
             populators["eager"].append((self.key, collections.loader))
@@ -2082,12 +2224,24 @@ class JoinedLoader(AbstractRelationshipLoader):
 
     """
 
-    __slots__ = "join_depth"
+    __slots__ = "join_depth", "_alt_selectable", "_primaryjoin_columns"
 
     def __init__(self, parent, strategy_key):
         super().__init__(parent, strategy_key)
         self.join_depth = self.parent_property.join_depth
 
+        # when the relationship targets an aliased class, eager joins
+        # alias its selectable rather than the mapper's
+        insp = inspect(self.entity)
+        if insp.is_aliased_class:
+            self._alt_selectable = insp.selectable
+        else:
+            self._alt_selectable = None
+
+        self._primaryjoin_columns = tuple(
+            sql_util._find_columns(self.parent_property.primaryjoin)
+        )
+
     def init_class_attribute(self, mapper):
         self.parent_property._get_strategy(
             (("lazy", "select"),)
@@ -2124,6 +2278,10 @@ class JoinedLoader(AbstractRelationshipLoader):
             else False
         )
 
+        with_poly_entity = path.get(
+            compile_state.attributes, "path_with_polymorphic", None
+        )
+
         if user_defined_adapter is not False:
             # setup an adapter but dont create any JOIN, assume it's already
             # in the query
@@ -2168,15 +2326,13 @@ class JoinedLoader(AbstractRelationshipLoader):
                 column_collection,
                 parentmapper,
                 chained_from_outerjoin,
+                with_poly_entity,
             )
 
             # for multi-row, we want to wrap limited/distinct SELECT,
             # because we want to put the JOIN on the outside.
             compile_state.eager_adding_joins = True
 
-        with_poly_entity = path.get(
-            compile_state.attributes, "path_with_polymorphic", None
-        )
         if with_poly_entity is not None:
             with_polymorphic = inspect(
                 with_poly_entity
@@ -2304,19 +2460,12 @@ class JoinedLoader(AbstractRelationshipLoader):
         column_collection,
         parentmapper,
         chained_from_outerjoin,
+        with_poly_entity,
     ):
-        with_poly_entity = path.get(
-            compile_state.attributes, "path_with_polymorphic", None
-        )
         if with_poly_entity:
             to_adapt = with_poly_entity
         else:
-            insp = inspect(self.entity)
-            if insp.is_aliased_class:
-                alt_selectable = insp.selectable
-            else:
-                alt_selectable = None
-
+            alt_selectable = self._alt_selectable
             to_adapt = orm_util.AliasedClass(
                 self.mapper,
                 alias=alt_selectable._anonymous_fromclause(flat=True)
@@ -2463,11 +2612,13 @@ class JoinedLoader(AbstractRelationshipLoader):
 
         assert clauses.is_aliased_class
 
+        represents_outer_join = query_entity.entity_zero.represents_outer_join
+
         attach_on_outside = (
             not chained_from_outerjoin
             or not innerjoin
             or innerjoin == "unnested"
-            or query_entity.entity_zero.represents_outer_join
+            or represents_outer_join
         )
 
         extra_join_criteria = extra_criteria
@@ -2488,7 +2639,7 @@ class JoinedLoader(AbstractRelationshipLoader):
                 clauses.aliased_insp,
                 onclause,
                 isouter=not innerjoin
-                or query_entity.entity_zero.represents_outer_join
+                or represents_outer_join
                 or (chained_from_outerjoin and isinstance(towrap, sql.Join)),
                 _left_memo=self.parent,
                 _right_memo=self.mapper,
@@ -2513,21 +2664,21 @@ class JoinedLoader(AbstractRelationshipLoader):
             # by the Query propagates those columns outward.
             # This has the effect
             # of "undefering" those columns.
-            for col in sql_util._find_columns(
-                self.parent_property.primaryjoin
-            ):
-                if localparent.persist_selectable.c.contains_column(col):
+            parent_cols = localparent.persist_selectable.c
+            for col in self._primaryjoin_columns:
+                if parent_cols.contains_column(col):
                     if adapter:
                         col = adapter.columns[col]
                     compile_state._append_dedupe_col_collection(
                         col, compile_state.primary_columns
                     )
 
-        if self.parent_property.order_by:
+        # order_by is resolved to a tuple of columns once the relationship
+        # is configured, so it can be traversed without copying to a list
+        order_by = self.parent_property.order_by
+        if order_by:
             compile_state.eager_order_by += tuple(
-                (eagerjoin._target_adapter.copy_and_process)(
-                    util.to_list(self.parent_property.order_by)
-                )
+                eagerjoin._target_adapter.copy_and_process(order_by)
             )
 
     def _splice_nested_inner_join(
@@ -2542,28 +2693,25 @@ class JoinedLoader(AbstractRelationshipLoader):
             # first call is always handed a join object
             # from the outside
             assert isinstance(join_obj, orm_util._ORMJoin)
-        elif isinstance(join_obj, sql.selectable.FromGrouping):
-            return self._splice_nested_inner_join(
-                path,
-                join_obj.element,
-                clauses,
-                onclause,
-                extra_criteria,
-                splicing,
-            )
-        elif not isinstance(join_obj, orm_util._ORMJoin):
-            if path[-2].isa(splicing):
-                return orm_util._ORMJoin(
-                    join_obj,
-                    clauses.aliased_insp,
-                    onclause,
-                    isouter=False,
-                    _left_memo=splicing,
-                    _right_memo=path[-1].mapper,
-                    _extra_criteria=extra_criteria,
-                )
-            else:
-                return None
+        else:
+            # unwrap any parenthesization in place rather than
+            # recursing once per level of grouping
+            while isinstance(join_obj, sql.selectable.FromGrouping):
+                join_obj = join_obj.element
+
+            if not isinstance(join_obj, orm_util._ORMJoin):
+                if path[-2].isa(splicing):
+                    return orm_util._ORMJoin(
+                        join_obj,
+                        clauses.aliased_insp,
+                        onclause,
+                        isouter=False,
+                        _left_memo=splicing,
+                        _right_memo=path[-1].mapper,
+                        _extra_criteria=extra_criteria,
+                    )
+                else:
+                    return None
 
         target_join = self._splice_nested_inner_join(
             path,
@@ -2714,6 +2862,8 @@ class JoinedLoader(AbstractRelationshipLoader):
             )
 
     def _create_collection_loader(self, context, key, _instance, populators):
+        context_attributes = context.attributes
+
         def load_collection_from_joined_new_row(state, dict_, row):
             # note this must unconditionally clear out any existing collection.
             # an existing collection would be present only in the case of
@@ -2722,15 +2872,14 @@ class JoinedLoader(AbstractRelationshipLoader):
             result_list = util.UniqueAppender(
                 collection, "append_without_event"
             )
-            context.attributes[(state, key)] = result_list
+            context_attributes[(state, key)] = result_list
             inst = _instance(row)
             if inst is not None:
                 result_list.append(inst)
 
         def load_collection_from_joined_existing_row(state, dict_, row):
-            if (state, key) in context.attributes:
-                result_list = context.attributes[(state, key)]
-            else:
+            result_list = context_attributes.get((state, key))
+            if result_list is None:
                 # appender_key can be absent from context.attributes
                 # with isnew=False when self-referential eager loading
                 # is used; the same instance may be present in two
@@ -2741,7 +2890,7 @@ class JoinedLoader(AbstractRelationshipLoader):
                 result_list = util.UniqueAppender(
                     collection, "append_without_event"
                 )
-                context.attributes[(state, key)] = result_list
+                context_attributes[(state, key)] = result_list
             inst = _instance(row)
             if inst is not None:
                 result_list.append(inst)
@@ -2807,6 +2956,7 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         "_parent_alias",
         "_query_info",
         "_fallback_query_info",
+        "_select_template",
     )
 
     query_info = collections.namedtuple(
@@ -2905,6 +3055,73 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             zero_idx = True
         return self.query_info(False, True, in_expr, pk_cols, zero_idx, None)
 
+    def _memoized_attr__select_template(self):
+        # base SELECT for the common case of the primary query info against
+        # the plain target entity; _load_for_path() only applies generative
+        # methods to it
+        return self._create_select(self._query_info, self.entity)
+
+    def _create_select(self, query_info, effective_entity):
+        pk_cols = query_info.pk_cols
+        in_expr = query_info.in_expr
+        eager_order_by = self.parent_property.order_by
+
+        if not query_info.load_with_join:
+            # in "omit join" mode, the primary key column, the
+            # "in" expression and the ORDER BY are in terms of the related
+            # entity.  So if the related entity is polymorphic or otherwise
+            # aliased, we need to adapt them to that entity.  in
+            # non-"omit join" mode, these are against the parent entity and
+            # do not need adaption.
+            if effective_entity.is_aliased_class:
+                pk_cols = [
+                    effective_entity._adapt_element(col) for col in pk_cols
+                ]
+                in_expr = effective_entity._adapt_element(in_expr)
+                if eager_order_by:
+                    eager_order_by = [
+                        effective_entity._adapt_element(elem)
+                        for elem in eager_order_by
+                    ]
+
+        bundle_ent = orm_util.Bundle("pk", *pk_cols)
+        bundle_sql = bundle_ent.__clause_element__()
+
+        entity_sql = effective_entity.__clause_element__()
+        q = Select._create_raw_select(
+            _raw_columns=[bundle_sql, entity_sql],
+            _label_style=LABEL_STYLE_TABLENAME_PLUS_COL,
+            _compile_options=ORMCompileState.default_compile_options,
+            _propagate_attrs={
+                "compile_state_plugin": "orm",
+                "plugin_subject": effective_entity,
+            },
+        )
+
+        if not query_info.load_with_join:
+            # the Bundle we have in the "omit_join" case is against raw, non
+            # annotated columns, so to ensure the Query knows its primary
+            # entity, we add it explicitly.  If we made the Bundle against
+            # annotated columns, we hit a performance issue in this specific
+            # case, which is detailed in issue #4347.
+            q = q.select_from(effective_entity)
+        else:
+            # in the non-omit_join case, the Bundle is against the annotated/
+            # mapped column of the parent entity, but the #4347 issue does not
+            # occur in this case.
+            q = q.select_from(self._parent_alias).join(
+                getattr(self._parent_alias, self.parent_property.key).of_type(
+                    effective_entity
+                )
+            )
+
+        q = q.filter(in_expr.in_(sql.bindparam("primary_keys")))
+
+        if eager_order_by and not query_info.load_with_join:
+            q = q.order_by(*eager_order_by)
+
+        return q
+
     def init_class_attribute(self, mapper):
         self.parent_property._get_strategy(
             (("lazy", "select"),)
@@ -3006,18 +3223,19 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             our_states = collections.defaultdict(list)
             none_states = []
 
-            mapper = self.parent
+            get_state_attr_by_column = self.parent._get_state_attr_by_column
+            child_lookup_cols = query_info.child_lookup_cols
 
             for state, overwrite in states:
                 state_dict = state.dict
                 related_ident = tuple(
-                    mapper._get_state_attr_by_column(
+                    get_state_attr_by_column(
                         state,
                         state_dict,
                         lk,
                         passive=attributes.PASSIVE_NO_FETCH,
                     )
-                    for lk in query_info.child_lookup_cols
+                    for lk in child_lookup_cols
                 )
                 # if the loaded parent objects do not have the foreign key
                 # to the related item loaded, then degrade into the joined
@@ -3043,55 +3261,25 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                 (state.key[1], state, state.dict, overwrite)
                 for state, overwrite in states
             ]
+        elif not our_states:
+            # every parent has None for the foreign key; there's nothing to
+            # SELECT, only empty values to populate
+            self._populate_none_states(none_states)
+            return
 
-        pk_cols = query_info.pk_cols
-        in_expr = query_info.in_expr
-
-        if not query_info.load_with_join:
-            # in "omit join" mode, the primary key column and the
-            # "in" expression are in terms of the related entity.  So
-            # if the related entity is polymorphic or otherwise aliased,
-            # we need to adapt our "pk_cols" and "in_expr" to that
-            # entity.   in non-"omit join" mode, these are against the
-            # parent entity and do not need adaption.
-            if effective_entity.is_aliased_class:
-                pk_cols = [
-                    effective_entity._adapt_element(col) for col in pk_cols
-                ]
-                in_expr = effective_entity._adapt_element(in_expr)
-
-        bundle_ent = orm_util.Bundle("pk", *pk_cols)
-        bundle_sql = bundle_ent.__clause_element__()
-
-        entity_sql = effective_entity.__clause_element__()
-        q = Select._create_raw_select(
-            _raw_columns=[bundle_sql, entity_sql],
-            _label_style=LABEL_STYLE_TABLENAME_PLUS_COL,
-            _compile_options=ORMCompileState.default_compile_options,
-            _propagate_attrs={
-                "compile_state_plugin": "orm",
-                "plugin_subject": effective_entity,
-            },
-        )
-
-        if not query_info.load_with_join:
-            # the Bundle we have in the "omit_join" case is against raw, non
-            # annotated columns, so to ensure the Query knows its primary
-            # entity, we add it explicitly.  If we made the Bundle against
-            # annotated columns, we hit a performance issue in this specific
-            # case, which is detailed in issue #4347.
-            q = q.select_from(effective_entity)
-        else:
-            # in the non-omit_join case, the Bundle is against the annotated/
-            # mapped column of the parent entity, but the #4347 issue does not
-            # occur in this case.
-            q = q.select_from(self._parent_alias).join(
-                getattr(self._parent_alias, self.parent_property.key).of_type(
-                    effective_entity
-                )
+        if effective_entity is not self.entity:
+            # with_polymorphic() target; the AliasedInsp comes from the
+            # cached statement, so memoize the adapted SELECT on it
+            q = effective_entity._memo(
+                ("selectinload_select", self, query_info.load_with_join),
+                self._create_select,
+                query_info,
+                effective_entity,
             )
-
-        q = q.filter(in_expr.in_(sql.bindparam("primary_keys")))
+        elif query_info is self._query_info:
+            q = self._select_template
+        else:
+            q = self._create_select(query_info, effective_entity)
 
         # a test which exercises what these comments talk about is
         # test_selectin_relations.py -> test_twolevel_selectin_w_polymorphic
@@ -3163,26 +3351,18 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         if context.populate_existing:
             q = q.execution_options(populate_existing=True)
 
-        if self.parent_property.order_by:
-            if not query_info.load_with_join:
-                eager_order_by = self.parent_property.order_by
-                if effective_entity.is_aliased_class:
-                    eager_order_by = [
-                        effective_entity._adapt_element(elem)
-                        for elem in eager_order_by
-                    ]
-                q = q.order_by(*eager_order_by)
-            else:
-
-                def _setup_outermost_orderby(compile_context):
-                    compile_context.eager_order_by += tuple(
-                        util.to_list(self.parent_property.order_by)
-                    )
+        # in "omit join" mode the ORDER BY is part of the base SELECT
+        if self.parent_property.order_by and query_info.load_with_join:
 
-                q = q._add_context_option(
-                    _setup_outermost_orderby, self.parent_property
+            def _setup_outermost_orderby(compile_context):
+                compile_context.eager_order_by += tuple(
+                    util.to_list(self.parent_property.order_by)
                 )
 
+            q = q._add_context_option(
+                _setup_outermost_orderby, self.parent_property
+            )
+
         if query_info.load_only_child:
             self._load_via_child(
                 our_states,
@@ -3210,19 +3390,20 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
 
         # this sort is really for the benefit of the unit tests
         our_keys = sorted(our_states)
-        while our_keys:
-            chunk = our_keys[0 : self._chunksize]
-            our_keys = our_keys[self._chunksize :]
+        zero_idx = query_info.zero_idx
+        chunksize = self._chunksize
+        for start in range(0, len(our_keys), chunksize):
+            chunk = our_keys[start : start + chunksize]
+            if zero_idx:
+                primary_keys = [key[0] for key in chunk]
+            else:
+                primary_keys = chunk
+
             data = {
                 k: v
                 for k, v in context.session.execute(
                     q,
-                    params={
-                        "primary_keys": [
-                            key[0] if query_info.zero_idx else key
-                            for key in chunk
-                        ]
-                    },
+                    params={"primary_keys": primary_keys},
                     execution_options=execution_options,
                 ).unique()
             }
@@ -3243,6 +3424,9 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                         dict_,
                         related_obj if not uselist else [related_obj],
                     )
+        self._populate_none_states(none_states)
+
+    def _populate_none_states(self, none_states):
         # populate none states with empty value / collection
         for state, dict_, overwrite in none_states:
             if not overwrite and self.key in dict_:
@@ -3256,49 +3440,58 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         self, our_states, query_info, q, context, execution_options
     ):
         uselist = self.uselist
-        _empty_result = () if uselist else None
+        zero_idx = query_info.zero_idx
 
-        while our_states:
-            chunk = our_states[0 : self._chunksize]
-            our_states = our_states[self._chunksize :]
+        chunksize = self._chunksize
+        for start in range(0, len(our_states), chunksize):
+            chunk = our_states[start : start + chunksize]
 
-            primary_keys = [
-                key[0] if query_info.zero_idx else key
-                for key, state, state_dict, overwrite in chunk
-            ]
+            if zero_idx:
+                primary_keys = [key[0] for key, _, _, _ in chunk]
+            else:
+                primary_keys = [key for key, _, _, _ in chunk]
 
-            data = collections.defaultdict(list)
-            for k, v in itertools.groupby(
-                context.session.execute(
-                    q,
-                    params={"primary_keys": primary_keys},
-                    execution_options=execution_options,
-                ).unique(),
-                lambda x: x[0],
-            ):
-                data[k].extend(vv[1] for vv in v)
+            rows = context.session.execute(
+                q,
+                params={"primary_keys": primary_keys},
+                execution_options=execution_options,
+            ).unique()
+
+            if uselist:
+                data = collections.defaultdict(list)
+                for k, v in rows:
+                    data[k].append(v)
 
-            for key, state, state_dict, overwrite in chunk:
-                if not overwrite and self.key in state_dict:
-                    continue
+                for key, state, state_dict, overwrite in chunk:
+                    if not overwrite and self.key in state_dict:
+                        continue
 
-                collection = data.get(key, _empty_result)
+                    state.get_impl(self.key).set_committed_value(
+                        state, state_dict, data.get(key, ())
+                    )
+            else:
+                # scalar relationship; keep the first row for each key and
+                # note the keys that got more than one
+                data = {}
+                multiple_rows = set()
+                for k, v in rows:
+                    if k in data:
+                        multiple_rows.add(k)
+                    else:
+                        data[k] = v
+
+                for key, state, state_dict, overwrite in chunk:
+                    if not overwrite and self.key in state_dict:
+                        continue
 
-                if not uselist and collection:
-                    if len(collection) > 1:
+                    if key in multiple_rows:
                         util.warn(
                             "Multiple rows returned with "
                             "uselist=False for eagerly-loaded "
                             "attribute '%s' " % self
                         )
                     state.get_impl(self.key).set_committed_value(
-                        state, state_dict, collection[0]
-                    )
-                else:
-                    # note that empty tuple set on uselist=False sets the
-                    # value to None
-                    state.get_impl(self.key).set_committed_value(
-                        state, state_dict, collection
+                        state, state_dict, data.get(key)
                     )
 
 
@@ -15,6 +15,7 @@ from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import strategies
 from sqlalchemy.orm import subqueryload
 from sqlalchemy.orm import undefer
 from sqlalchemy.orm import with_polymorphic
@@ -1352,6 +1353,39 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         assert len(o4.__dict__["address"])
         eq_(o5.__dict__["address"], [])
 
+    def test_m2o_none_value_only(self):
+        orders, Order, addresses, Address = (
+            self.tables.orders,
+            self.classes.Order,
+            self.tables.addresses,
+            self.classes.Address,
+        )
+
+        self.mapper_registry.map_imperatively(
+            Order,
+            orders,
+            properties={"address": relationship(Address, lazy="selectin")},
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+
+        sess = fixture_session()
+        q = sess.query(Order).filter(Order.id == 5)
+
+        def go():
+            (o5,) = q.all()
+            assert o5.__dict__["address"] is None
+
+        # no SELECT is built or emitted for the relationship when every
+        # parent has None for the foreign key
+        with mock.patch.object(
+            strategies.SelectInLoader,
+            "_create_select",
+            autospec=True,
+            side_effect=strategies.SelectInLoader._create_select,
+        ) as create_select:
+            self.assert_sql_count(testing.db, go, 1)
+        eq_(create_select.mock_calls, [])
+
     def test_o2m_empty_list_present(self):
         Address, addresses, users, User = (
             self.classes.Address,
@@ -1,5 +1,6 @@
 import sqlalchemy as sa
 from sqlalchemy import bindparam
+from sqlalchemy import event
 from sqlalchemy import ForeignKey
 from sqlalchemy import Integer
 from sqlalchemy import literal_column
@@ -20,17 +21,22 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm import subqueryload
 from sqlalchemy.orm import undefer
 from sqlalchemy.orm import with_polymorphic
+from sqlalchemy.orm.events import QueryEvents
+from sqlalchemy.orm.query import Query
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import assert_warns
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_true
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.assertsql import Or
 from sqlalchemy.testing.entities import ComparableEntity
 from sqlalchemy.testing.fixtures import fixture_session
+from sqlalchemy.testing.fixtures import RemoveORMEventsGlobally
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from test.orm import _fixtures
@@ -1514,6 +1520,77 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         )
 
 
+class BeforeCompileTest(RemoveORMEventsGlobally, _fixtures.FixtureTest):
+    """test the Query and plain Select paths in
+    SubqueryLoader._generate_from_original_query()."""
+
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        User, Address = cls.classes("User", "Address")
+        users, addresses = cls.tables("users", "addresses")
+
+        cls.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    cls.mapper_registry.map_imperatively(Address, addresses),
+                    order_by=Address.id,
+                )
+            },
+        )
+
+    @testing.combinations((True,), (False,), argnames="use_listener")
+    def test_select_with_core_compile_options(self, use_listener):
+        User, Address = self.classes("User", "Address")
+
+        canary = mock.Mock()
+        if use_listener:
+            event.listen(Query, "before_compile", canary)
+
+        # without a listener, the select() is used directly
+        is_(Query._has_before_compile_events, use_listener)
+
+        cache = {}
+
+        def go():
+            stmt = (
+                select(User)
+                .where(User.id == 7)
+                .options(subqueryload(User.addresses))
+            )
+            with testing.db.connect() as conn:
+                sess = Session(conn.execution_options(compiled_cache=cache))
+                eq_(
+                    sess.scalars(stmt).all(),
+                    [
+                        User(
+                            id=7,
+                            addresses=[
+                                Address(id=1, email_address="jack@bean.com")
+                            ],
+                        )
+                    ],
+                )
+
+        # the second run is a compiled cache hit, where the loader receives
+        # a new select() that still has Core level compile options
+        self.assert_sql_count(testing.db, go, 2)
+        self.assert_sql_count(testing.db, go, 2)
+
+        eq_(canary.called, use_listener)
+
+    def test_clear_resets_flag(self):
+        event.listen(Query, "before_compile", mock.Mock())
+        is_true(Query._has_before_compile_events)
+
+        QueryEvents._clear()
+        is_false(Query._has_before_compile_events)
+
+
 class LoadOnExistingTest(_fixtures.FixtureTest):
     """test that loaders from a base Query fully populate."""
 
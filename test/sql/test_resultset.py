@@ -551,6 +551,25 @@ class CursorResultTest(fixtures.TablesTest):
                 lambda: row._mapping[accessor],
             )
 
+    def test_getter_for_first_present(self, connection):
+        users = self.tables.users
+
+        connection.execute(users.insert(), {"user_id": 7, "user_name": "jack"})
+        result = connection.execute(select(users.c.user_name))
+        row = result.first()
+
+        getter = result._getter_for_first_present(
+            [Column("q", Integer), users.c.user_id, users.c.user_name]
+        )
+        eq_(getter(row), "jack")
+
+        is_(
+            result._getter_for_first_present(
+                [Column("q", Integer), users.c.user_id]
+            ),
+            None,
+        )
+
     def test_fetchmany(self, connection):
         users = self.tables.users
 